@@ -0,0 +1,125 @@
+"""
+Benchmark de arranque de la CLI.
+
+Mide dos cosas:
+  - Tiempo de importación de cli.py (en un intérprete nuevo por corrida).
+  - Arranque en frío con estado: reconstruir la clínica objeto por objeto
+    frente a cargar una imagen de estado precompilada.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_arranque [--pacientes N] [--medicos N] [--turnos N] [--corridas N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Script que reconstruye la clínica desde cero, como haría un script de carga
+RECONSTRUIR = """
+import sys
+from datetime import datetime, timedelta
+from clinica import Clinica
+from modelos.paciente import Paciente
+from modelos.medico import Medico
+from modelos.especialidad import Especialidad
+
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+pacientes, medicos, turnos = map(int, sys.argv[1:4])
+clinica = Clinica()
+for i in range(pacientes):
+    clinica.agregar_paciente(Paciente(f"Paciente {i}", f"{i:08d}", "01/01/1990"))
+for i in range(medicos):
+    medico = Medico(f"Medico {i}", f"M{i:04d}")
+    medico.agregar_especialidad(Especialidad("Clínica", DIAS))
+    clinica.agregar_medico(medico)
+inicio = datetime(2025, 1, 6, 8, 0)
+for i in range(turnos):
+    clinica.agendar_turno(
+        f"{i % pacientes:08d}", f"M{i % medicos:04d}", "Clínica",
+        inicio + timedelta(minutes=15 * (i // medicos)),
+    )
+"""
+
+CARGAR_IMAGEN = """
+import sys
+from cli import crear_cli
+crear_cli(["--imagen", sys.argv[1]])
+"""
+
+
+def medir_proceso(argumentos, corridas):
+    """Ejecuta un intérprete nuevo `corridas` veces y devuelve los tiempos en ms."""
+    tiempos = []
+    for _ in range(corridas):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, *argumentos], cwd=RAIZ, check=True)
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return tiempos
+
+
+def importacion_acumulada(modulo):
+    """Devuelve el tiempo acumulado (µs) de importar `modulo` según -X importtime."""
+    resultado = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=RAIZ, check=True, capture_output=True, text=True,
+    )
+    for linea in resultado.stderr.splitlines():
+        partes = [p.strip() for p in linea.split("|")]
+        if len(partes) == 3 and partes[2] == modulo:
+            return int(partes[1])
+    return None
+
+
+def construir_imagen(ruta, pacientes, medicos, turnos):
+    """Genera una imagen de estado con la misma carga que RECONSTRUIR."""
+    sys.path.insert(0, RAIZ)
+    from persistencia.imagen_estado import guardar_imagen
+
+    espacio = {"__name__": "__bench__"}
+    argv = sys.argv
+    sys.argv = ["", str(pacientes), str(medicos), str(turnos)]
+    try:
+        exec(RECONSTRUIR, espacio)
+    finally:
+        sys.argv = argv
+    guardar_imagen(espacio["clinica"], ruta)
+
+
+def resumir(nombre, tiempos):
+    print(f"{nombre:<32} mediana {statistics.median(tiempos):8.2f} ms   "
+          f"mín {min(tiempos):8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pacientes", type=int, default=2000)
+    parser.add_argument("--medicos", type=int, default=50)
+    parser.add_argument("--turnos", type=int, default=5000)
+    parser.add_argument("--corridas", type=int, default=10)
+    args = parser.parse_args()
+    carga = [str(args.pacientes), str(args.medicos), str(args.turnos)]
+
+    print("== Importación ==")
+    print(f"cli (acumulado -X importtime)    {importacion_acumulada('cli')} µs")
+    resumir("intérprete vacío", medir_proceso(["-c", "pass"], args.corridas))
+    resumir("import cli", medir_proceso(["-c", "import cli"], args.corridas))
+
+    print(f"\n== Arranque en frío ({args.pacientes} pacientes, "
+          f"{args.medicos} médicos, {args.turnos} turnos) ==")
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "clinica.img")
+        construir_imagen(ruta, args.pacientes, args.medicos, args.turnos)
+        print(f"tamaño de la imagen              {os.path.getsize(ruta) / 1024:.1f} KiB")
+        resumir("reconstrucción objeto a objeto",
+                medir_proceso(["-c", RECONSTRUIR, *carga], args.corridas))
+        resumir("cli --imagen",
+                medir_proceso(["-c", CARGAR_IMAGEN, ruta], args.corridas))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Reproduce una carga de trabajo grabada sobre Clinica con el modo traza activo.
+
+La carga es un archivo JSON Lines con una operación por línea:
+    {"op": "agregar_paciente", "nombre": "...", "dni": "...", "fecha_nacimiento": "dd/mm/aaaa"}
+    {"op": "agregar_medico", "nombre": "...", "matricula": "...",
+     "especialidades": [{"tipo": "...", "dias": ["lunes", ...]}]}
+    {"op": "agendar_turno", "dni": "...", "matricula": "...", "especialidad": "...",
+     "fecha_hora": "dd/mm/aaaa HH:MM"}
+    {"op": "emitir_receta", "dni": "...", "matricula": "...", "medicamentos": ["..."]}
+
+Los errores de negocio (turno duplicado, médico que no atiende ese día, etc.)
+se cuentan pero no detienen la reproducción.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.reproducir_carga carga.jsonl --plegado carga.folded --speedscope carga.speedscope.json
+    python -m benchmarks.reproducir_carga carga.jsonl --generar 5000
+
+El archivo --plegado se abre con flamegraph.pl, inferno o speedscope; el
+archivo --speedscope se abre en https://www.speedscope.app.
+"""
+import argparse
+import json
+import random
+from datetime import datetime, timedelta
+
+from clinica import Clinica
+from modelos.paciente import Paciente
+from modelos.medico import Medico
+from modelos.especialidad import Especialidad
+from perfilado.trazador import Trazador
+from excepciones.excepciones import (
+    PacienteNoExisteError,
+    MedicoNoExisteError,
+    TurnoDuplicadoError,
+    EspecialidadNoDisponibleError
+)
+
+ERRORES_NEGOCIO = (
+    PacienteNoExisteError,
+    MedicoNoExisteError,
+    TurnoDuplicadoError,
+    EspecialidadNoDisponibleError,
+)
+
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+ESPECIALIDADES = ["Clínica", "Pediatría", "Cardiología", "Dermatología", "Traumatología"]
+
+
+def ejecutar_operacion(clinica, operacion):
+    """Aplica una operación de la carga sobre la clínica."""
+    op = operacion["op"]
+    if op == "agregar_paciente":
+        clinica.agregar_paciente(Paciente(
+            operacion["nombre"], operacion["dni"], operacion["fecha_nacimiento"]
+        ))
+    elif op == "agregar_medico":
+        medico = Medico(operacion["nombre"], operacion["matricula"])
+        for especialidad in operacion["especialidades"]:
+            medico.agregar_especialidad(Especialidad(especialidad["tipo"], especialidad["dias"]))
+        clinica.agregar_medico(medico)
+    elif op == "agendar_turno":
+        fecha_hora = datetime.strptime(operacion["fecha_hora"], "%d/%m/%Y %H:%M")
+        clinica.agendar_turno(
+            operacion["dni"], operacion["matricula"], operacion["especialidad"], fecha_hora
+        )
+    elif op == "emitir_receta":
+        clinica.emitir_receta(operacion["dni"], operacion["matricula"], operacion["medicamentos"])
+    else:
+        raise ValueError(f"Operación desconocida: {op}")
+
+
+def reproducir(ruta, trazador):
+    """
+    Reproduce la carga del archivo sobre una clínica nueva con el trazador
+    activo.
+
+    Retorno:
+        dict: operación → {"ok": int, "errores": int}.
+    """
+    clinica = Clinica()
+    clinica.activar_trazado(trazador)
+    conteo = {}
+    with open(ruta, encoding="utf-8") as archivo:
+        for linea in archivo:
+            if not linea.strip():
+                continue
+            operacion = json.loads(linea)
+            datos = conteo.setdefault(operacion["op"], {"ok": 0, "errores": 0})
+            try:
+                ejecutar_operacion(clinica, operacion)
+                datos["ok"] += 1
+            except ERRORES_NEGOCIO:
+                datos["errores"] += 1
+    return conteo
+
+
+def generar_carga(ruta, turnos, pacientes=500, medicos=20, semilla=0):
+    """
+    Genera una carga sintética: altas de pacientes y médicos seguidas de
+    turnos (con algunos duplicados y días sin atención) y recetas.
+    """
+    azar = random.Random(semilla)
+    inicio = datetime(2025, 1, 6, 8, 0)
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        def escribir(operacion):
+            archivo.write(json.dumps(operacion, ensure_ascii=False) + "\n")
+
+        for i in range(pacientes):
+            escribir({"op": "agregar_paciente", "nombre": f"Paciente {i}",
+                      "dni": f"{i:08d}", "fecha_nacimiento": "01/01/1990"})
+        agenda = []
+        for i in range(medicos):
+            especialidades = []
+            for tipo in azar.sample(ESPECIALIDADES, 2):
+                dias = sorted(azar.sample(DIAS[:6], 3), key=DIAS.index)
+                especialidades.append({"tipo": tipo, "dias": dias})
+            agenda.append(especialidades)
+            escribir({"op": "agregar_medico", "nombre": f"Medico {i}",
+                      "matricula": f"M{i:04d}", "especialidades": especialidades})
+        for _ in range(turnos):
+            dni = f"{azar.randrange(pacientes):08d}"
+            medico = azar.randrange(medicos)
+            especialidad = azar.choice(agenda[medico])
+            # inicio es lunes: se elige uno de los días de atención en 4 semanas
+            dia = DIAS.index(azar.choice(especialidad["dias"])) + 7 * azar.randrange(4)
+            fecha_hora = inicio + timedelta(days=dia, minutes=15 * azar.randrange(40))
+            escribir({"op": "agendar_turno", "dni": dni, "matricula": f"M{medico:04d}",
+                      "especialidad": especialidad["tipo"],
+                      "fecha_hora": fecha_hora.strftime("%d/%m/%Y %H:%M")})
+            if azar.random() < 0.2:
+                escribir({"op": "emitir_receta", "dni": dni, "matricula": f"M{medico:04d}",
+                          "medicamentos": ["Ibuprofeno"]})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("carga", help="archivo JSON Lines con la carga de trabajo")
+    parser.add_argument("--generar", type=int, metavar="TURNOS",
+                        help="genera una carga sintética con esa cantidad de turnos y sale")
+    parser.add_argument("--capacidad", type=int, default=65536,
+                        help="registros guardados en el buffer circular del trazador")
+    parser.add_argument("--plegado", help="archivo de salida en formato de pilas plegadas")
+    parser.add_argument("--speedscope", help="archivo de salida en formato speedscope")
+    args = parser.parse_args()
+
+    if args.generar is not None:
+        generar_carga(args.carga, args.generar)
+        print(f"Carga generada en {args.carga}.")
+        return
+
+    trazador = Trazador(args.capacidad)
+    conteo = reproducir(args.carga, trazador)
+
+    for op, datos in conteo.items():
+        print(f"{op:<20} ok {datos['ok']:>7}   errores {datos['errores']:>7}")
+    print()
+    print(f"{'etapa':<48} {'llamadas':>9} {'total ms':>10} {'propio ms':>10}")
+    for pila, datos in sorted(trazador.resumen().items()):
+        print(f"{pila:<48} {datos['llamadas']:>9} "
+              f"{datos['total_ns'] / 1e6:>10.2f} {datos['propio_ns'] / 1e6:>10.2f}")
+
+    descartados = trazador.obtener_descartados()
+    if descartados:
+        print(f"\nAtención: se descartaron {descartados} registros por falta de lugar en el "
+              f"buffer; el resumen y los archivos exportados solo cubren los últimos "
+              f"{args.capacidad}. Aumente --capacidad para conservarlos todos.")
+
+    if args.plegado:
+        with open(args.plegado, "w", encoding="utf-8") as archivo:
+            trazador.exportar_pilas_plegadas(archivo)
+    if args.speedscope:
+        with open(args.speedscope, "w", encoding="utf-8") as archivo:
+            trazador.exportar_speedscope(archivo, nombre=args.carga)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+from collections import OrderedDict
+
+class CacheConsultas:
+    def __init__(self, capacidad=256):
+        """
+        Caché LRU acotada para resultados de consultas ya calculados.
+
+        Las claves son tuplas cuyo primer elemento es el tipo de consulta
+        (por ejemplo "historia") y que incluyen el contador de versión de la
+        entidad consultada. Al cambiar la entidad cambia la versión, por lo
+        que las entradas viejas nunca vuelven a acertarse y terminan
+        desalojadas por antigüedad.
+
+        Parámetros:
+            capacidad (int): cantidad máxima de resultados guardados.
+        """
+        if capacidad < 1:
+            raise ValueError("La capacidad de la caché debe ser al menos 1.")
+        self.__capacidad__ = capacidad
+        self.__entradas__ = OrderedDict()
+        self.__aciertos__ = {}
+        self.__fallos__ = {}
+        self.__desalojos__ = 0
+
+    def obtener(self, clave, calcular):
+        """
+        Devuelve el resultado guardado para la clave o lo calcula y lo guarda.
+
+        Parámetros:
+            clave (tuple): (tipo_consulta, ...) identificando la consulta.
+            calcular (callable): función sin argumentos que produce el resultado.
+
+        Retorno:
+            El resultado guardado o recién calculado.
+        """
+        tipo = clave[0]
+        if clave in self.__entradas__:
+            self.__entradas__.move_to_end(clave)
+            self.__aciertos__[tipo] = self.__aciertos__.get(tipo, 0) + 1
+            return self.__entradas__[clave]
+
+        self.__fallos__[tipo] = self.__fallos__.get(tipo, 0) + 1
+        resultado = calcular()
+        self.__entradas__[clave] = resultado
+        if len(self.__entradas__) > self.__capacidad__:
+            # Se desaloja la entrada usada hace más tiempo
+            self.__entradas__.popitem(last=False)
+            self.__desalojos__ += 1
+        return resultado
+
+    def estadisticas(self):
+        """
+        Devuelve las estadísticas de uso de la caché.
+
+        Retorno:
+            dict: aciertos, fallos, tasa_aciertos, desalojos, tamanio,
+            capacidad y el detalle por tipo de consulta en "por_consulta".
+        """
+        por_consulta = {}
+        for tipo in sorted(set(self.__aciertos__) | set(self.__fallos__)):
+            aciertos = self.__aciertos__.get(tipo, 0)
+            fallos = self.__fallos__.get(tipo, 0)
+            por_consulta[tipo] = {
+                "aciertos": aciertos,
+                "fallos": fallos,
+                "tasa_aciertos": aciertos / (aciertos + fallos),
+            }
+        aciertos = sum(self.__aciertos__.values())
+        fallos = sum(self.__fallos__.values())
+        total = aciertos + fallos
+        return {
+            "aciertos": aciertos,
+            "fallos": fallos,
+            "tasa_aciertos": aciertos / total if total else 0.0,
+            "desalojos": self.__desalojos__,
+            "tamanio": len(self.__entradas__),
+            "capacidad": self.__capacidad__,
+            "por_consulta": por_consulta,
+        }
@@ -1,19 +1,13 @@
-from datetime import datetime
+import sys
 from clinica import Clinica
-from modelos.paciente import Paciente
-from modelos.especialidad import Especialidad
-from modelos.medico import Medico
-from excepciones.excepciones import (
-    PacienteNoExisteError,
-    MedicoNoExisteError,
-    TurnoDuplicadoError,
-    EspecialidadNoDisponibleError
-)
+
+# Los modelos, excepciones y utilidades que solo usa una opción del menú se
+# importan dentro del método correspondiente, así el arranque no los carga.
 
 class CLI:
 
-    def __init__(self):
-        self.__clinica__= Clinica()
+    def __init__(self, clinica=None):
+        self.__clinica__= clinica if clinica is not None else Clinica()
 
     def mostrar_menu(self):
         """
@@ -32,6 +26,8 @@ class CLI:
             print("7) Ver todos los turnos")
             print("8) Ver todos los pacientes")
             print("9) Ver todos los médicos")
+            print("10) Guardar imagen de estado")
+            print("11) Ver agenda de un médico")
             print("0) Salir")
             op = input("Opción: ").strip()
 
@@ -53,6 +49,10 @@ class CLI:
                 self.ver_pacientes()
             elif op == "9":
                 self.ver_medicos()
+            elif op == "10":
+                self.guardar_imagen()
+            elif op == "11":
+                self.ver_agenda_medico()
             elif op == "0":
                 print("¡Hasta luego!")
                 break
@@ -68,6 +68,8 @@ class CLI:
           - dni: str
           - fn:   str en formato dd/mm/aaaa
         """
+        from modelos.paciente import Paciente
+
         nombre = input("Nombre: ").strip()
         dni = input("DNI: ").strip()
         fn = input("F. Nac. (dd/mm/aaaa): ").strip()
@@ -85,6 +87,9 @@ class CLI:
           - mat:    str matrícula
           - esp:    str especialidad
         """
+        from modelos.medico import Medico
+        from modelos.especialidad import Especialidad
+
         nombre = input("Nombre: ").strip()
         mat = input("Matrícula: ").strip()
         medico = Medico(nombre, mat)
@@ -116,6 +121,14 @@ class CLI:
           - PacienteNoExisteError, MedicoNoExisteError, TurnoDuplicadoError,
             EspecialidadNoDisponibleError si hay problema de negocio.
         """
+        from datetime import datetime
+        from excepciones.excepciones import (
+            PacienteNoExisteError,
+            MedicoNoExisteError,
+            TurnoDuplicadoError,
+            EspecialidadNoDisponibleError
+        )
+
         dni = input("DNI paciente: ").strip()
         mat = input("Matrícula médico: ").strip()
         esp = input("Especialidad: ").strip()
@@ -132,6 +145,8 @@ class CLI:
             print("Error:", e)
 
     def agregar_especialidad_a_medico(self):
+        from modelos.especialidad import Especialidad
+
         mat = input("Matrícula médico: ").strip()
         medico = self.__clinica__.obtener_medico_por_matricula(mat)
         if not medico:
@@ -144,7 +159,7 @@ class CLI:
         dias = [d.strip() for d in dias_input.split(',') if d.strip()]
         
         especialidad = Especialidad(tipo, dias)
-        medico.agregar_especialidad(especialidad)
+        self.__clinica__.agregar_especialidad(mat, especialidad)
         print("Especialidad añadida al médico.")
 
 
@@ -156,6 +171,8 @@ class CLI:
           - meds: lista de medicamentos (cadena separada por comas)
         Llama a Clinica.emitir_receta y captura errores de negocio.
         """
+        from excepciones.excepciones import PacienteNoExisteError, MedicoNoExisteError
+
         dni = input("DNI paciente: ").strip()
         mat = input("Matrícula médico: ").strip()
         meds_input = input("Medicamentos (coma-sep): ").strip()
@@ -172,10 +189,12 @@ class CLI:
         Solicita el DNI de un paciente y muestra su historia clínica completa
         (turnos y recetas). Captura PacienteNoExisteError si no se encuentra.
         """
+        from excepciones.excepciones import PacienteNoExisteError
+
         dni = input("DNI paciente: ").strip()
         try:
-            historia = self.__clinica__.obtener_historia_clinica(dni)
-            print(historia)  # HistoriaClinica implementa __str__
+            # Texto ya renderizado, cacheado hasta que cambie la historia
+            print(self.__clinica__.obtener_historia_clinica_texto(dni))
         except PacienteNoExisteError as e:
             print("Error:", e)
 
@@ -215,6 +234,73 @@ class CLI:
             for medico in medicos:
                 print(medico)
 
+    def ver_agenda_medico(self):
+        """
+        Solicita la matrícula de un médico y una fecha, y muestra los turnos
+        de ese día ordenados por hora. Captura MedicoNoExisteError y
+        ValueError si la fecha no tiene formato dd/mm/aaaa.
+        """
+        from datetime import datetime
+        from excepciones.excepciones import MedicoNoExisteError
+
+        mat = input("Matrícula médico: ").strip()
+        fs = input("Fecha (dd/mm/aaaa): ").strip()
+        try:
+            fecha = datetime.strptime(fs, "%d/%m/%Y").date()
+            turnos = self.__clinica__.obtener_agenda_medico(mat, fecha)
+        except ValueError:
+            print("Formato de fecha inválido.")
+            return
+        except MedicoNoExisteError as e:
+            print("Error:", e)
+            return
+        if not turnos:
+            print("No hay turnos ese día.")
+        else:
+            for turno in turnos:
+                print(turno)
+
+    def guardar_imagen(self):
+        """
+        Solicita una ruta y guarda allí una imagen binaria del estado actual
+        de la clínica, que luego puede cargarse al iniciar con --imagen RUTA.
+        """
+        from persistencia.imagen_estado import guardar_imagen
+
+        ruta = input("Ruta de la imagen: ").strip()
+        try:
+            guardar_imagen(self.__clinica__, ruta)
+            print("Imagen guardada.")
+        except OSError as e:
+            print("Error:", e)
+
+
+def crear_cli(argumentos):
+    """
+    Crea la CLI a partir de los argumentos de línea de comandos.
+
+    Si se indica --imagen RUTA, la clínica se restaura desde esa imagen de
+    estado en lugar de comenzar vacía. Los argumentos desconocidos y las
+    imágenes que no se pueden leer terminan el programa con un mensaje de
+    uso, para no arrancar vacía por error y luego sobrescribir una imagen.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="cli.py", description="Sistema de gestión de la clínica.")
+    parser.add_argument("--imagen", metavar="RUTA",
+                        help="imagen de estado a cargar al iniciar")
+    args = parser.parse_args(argumentos)
+    if args.imagen is None:
+        return CLI()
+
+    from persistencia.imagen_estado import cargar_imagen
+    from excepciones.excepciones import ImagenEstadoInvalidaError
+
+    try:
+        return CLI(cargar_imagen(args.imagen))
+    except (OSError, ImagenEstadoInvalidaError) as e:
+        parser.error(f"no se pudo cargar la imagen: {e}")
+
 if __name__ == "__main__":
-    cli = CLI()
+    cli = crear_cli(sys.argv[1:])
     cli.mostrar_menu()
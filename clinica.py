@@ -1,9 +1,3 @@
-from datetime import datetime
-from modelos.paciente import Paciente
-from modelos.medico import Medico
-from modelos.turno import Turno
-from modelos.receta import Receta
-from modelos.historia_clinica import HistoriaClinica
 from excepciones.excepciones import (
     PacienteNoExisteError,
     MedicoNoExisteError,
@@ -11,19 +5,80 @@ from excepciones.excepciones import (
     EspecialidadNoDisponibleError
 )
 
+class _EtapaNula:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        return False
+
+class TrazadorNulo:
+    """
+    Trazador que no registra nada. Es el que usa Clinica mientras el modo
+    traza está apagado, para que las etapas instrumentadas casi no cuesten.
+    Se define aquí para que el arranque no importe perfilado.trazador.
+    """
+    __ETAPA__ = _EtapaNula()
+
+    def etapa(self, nombre):
+        return self.__ETAPA__
+
+TRAZADOR_NULO = TrazadorNulo()
+
 class Clinica:
-    def __init__(self):
+    def __init__(self, capacidad_cache=256):
         """
         Inicializa la clínica con estructuras vacías para:
          - pacientes: mapea DNI → Paciente
          - médicos:  mapea matrícula → Medico
          - turnos:   lista de Turno
          - historias_clinicas: mapea DNI → HistoriaClinica
+         - versiones: mapea ("paciente", DNI) o ("medico", matrícula) → int
+         - medicos_por_paciente: mapea DNI → list de Medico de su historia
+         - cache: CacheConsultas con hasta capacidad_cache resultados, que
+           se crea con la primera consulta cacheada
+         - trazador: Trazador del modo traza (TRAZADOR_NULO si está apagado)
         """
         self.__pacientes__ = {}
         self.__medicos__ = {}
         self.__turnos__ = []
         self.__historias_clinicas__ = {}
+        self.__versiones__ = {}
+        self.__medicos_por_paciente__ = {}
+        if capacidad_cache < 1:
+            raise ValueError("La capacidad de la caché debe ser al menos 1.")
+        self.__capacidad_cache__ = capacidad_cache
+        self.__cache__ = None
+        self.__trazador__ = TRAZADOR_NULO
+
+    def __getstate__(self):
+        # La caché y el trazador no forman parte del estado persistido;
+        # de la caché solo se guarda su capacidad (__capacidad_cache__)
+        estado = self.__dict__.copy()
+        estado.pop("__cache__", None)
+        estado.pop("__trazador__", None)
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self.__cache__ = None
+        self.__trazador__ = TRAZADOR_NULO
+
+    def activar_trazado(self, trazador):
+        """
+        Activa el modo traza: cada etapa de agendar_turno se registra en el
+        trazador indicado.
+
+        Parámetros:
+            trazador (perfilado.trazador.Trazador): destino de los registros.
+        """
+        self.__trazador__ = trazador
+
+    def desactivar_trazado(self):
+        """Apaga el modo traza."""
+        self.__trazador__ = TRAZADOR_NULO
 
     def agregar_paciente(self, paciente):
         """
@@ -36,11 +91,16 @@ class Clinica:
             - Añade el objeto Paciente al diccionario _pacientes por su DNI.
             - Crea una nueva HistoriaClinica vacía asociada a ese DNI.
         """
+        # Import diferido: solo se carga el modelo al registrar el primer paciente
+        from modelos.historia_clinica import HistoriaClinica
+
         dni = paciente.obtener_dni()
         # Guardamos el paciente bajo su DNI
         self.__pacientes__[dni] = paciente
         # Creamos la historia clínica vacía para este paciente
         self.__historias_clinicas__[dni] = HistoriaClinica(paciente)
+        self.__medicos_por_paciente__.pop(dni, None)
+        self.incrementar_version_paciente(dni)
 
     def agregar_medico(self, medico):
         """
@@ -54,6 +114,63 @@ class Clinica:
         """
         mat = medico.obtener_matricula()
         self.__medicos__[mat] = medico
+        self.incrementar_version_medico(mat)
+
+    def agregar_especialidad(self, matricula, especialidad):
+        """
+        Agrega una especialidad a un médico ya registrado.
+
+        Equivale a llamar Medico.agregar_especialidad: las consultas
+        cacheadas se invalidan por la revisión del médico.
+
+        Parámetros:
+            matricula (str): Matrícula del médico.
+            especialidad (Especialidad): especialidad y días de atención.
+
+        Excepciones:
+            MedicoNoExisteError: si el médico no existe.
+        """
+        self.validar_existencia_medico(matricula)
+        self.__medicos__[matricula].agregar_especialidad(especialidad)
+
+    def obtener_version(self, tipo, identificador):
+        """
+        Devuelve el contador de versión de una entidad.
+
+        Parámetros:
+            tipo (str): "paciente" o "medico".
+            identificador (str): DNI o matrícula.
+
+        Retorno:
+            int: versión actual (0 si la entidad nunca cambió).
+        """
+        return self.__versiones__.get((tipo, identificador), 0)
+
+    def incrementar_version_paciente(self, dni):
+        """
+        Marca como modificados los datos de un paciente, invalidando las
+        consultas cacheadas que dependen de él.
+        """
+        clave = ("paciente", dni)
+        self.__versiones__[clave] = self.__versiones__.get(clave, 0) + 1
+
+    def incrementar_version_medico(self, matricula):
+        """
+        Marca como modificada la agenda de un médico, invalidando sus agendas
+        y consultas de disponibilidad cacheadas. Los cambios en los datos del
+        propio médico se detectan con Medico.obtener_revision.
+        """
+        clave = ("medico", matricula)
+        self.__versiones__[clave] = self.__versiones__.get(clave, 0) + 1
+
+    def registrar_atencion(self, dni, medico):
+        """
+        Registra que el médico aparece en la historia clínica del paciente,
+        cuyo texto depende entonces de la revisión de ese médico.
+        """
+        medicos = self.__medicos_por_paciente__.setdefault(dni, [])
+        if medico not in medicos:
+            medicos.append(medico)
 
 
     def validar_existencia_paciente(self, dni):
@@ -178,29 +295,44 @@ class Clinica:
             PacienteNoExisteError: si el DNI no está registrado.
             MedicoNoExisteError: si la matrícula no está registrada.
             TurnoDuplicadoError: si ya existe un turno para ese médico en esa fecha y hora.
+
+        Con el modo traza activo (ver activar_trazado) se mide cada etapa.
         """
+        etapa = self.__trazador__.etapa
+        with etapa("agendar_turno"):
+            with etapa("validar_existencia"):
+                self.validar_existencia_medico(matricula)
+                self.validar_existencia_paciente(dni)
 
-        self.validar_existencia_medico(matricula)
-        self.validar_existencia_paciente(dni)
+                # Recuperar objetos
+                paciente = self.__pacientes__[dni]
+                medico    = self.__medicos__[matricula]
 
-        # Recuperar objetos
-        paciente = self.__pacientes__[dni]
-        medico    = self.__medicos__[matricula]
+            with etapa("resolver_dia_semana"):
+                dia_semana = self.obtener_dia_semana_en_espanol(fecha_hora)
 
-        dia_semana = self.obtener_dia_semana_en_espanol(fecha_hora)
+            with etapa("buscar_especialidad"):
+                especialidad = self.obtener_especialidad_disponible(medico, dia_semana)
 
-        especialidad = self.obtener_especialidad_disponible(medico, dia_semana)
+                self.validar_especialidad_en_dia(medico, esp, dia_semana)
 
-        self.validar_especialidad_en_dia(medico, esp, dia_semana)
+            with etapa("verificar_duplicado"):
+                self.validar_turno_no_duplicado(matricula, fecha_hora)
 
-        self.validar_turno_no_duplicado(matricula, fecha_hora)
+            with etapa("construir_turno"):
+                # Crear y almacenar el nuevo turno
+                from modelos.turno import Turno
+                nuevo = Turno(paciente, medico, fecha_hora, especialidad)
+                self.__turnos__.append(nuevo)
 
-        # Crear y almacenar el nuevo turno
-        nuevo = Turno(paciente, medico, fecha_hora, especialidad)
-        self.__turnos__.append(nuevo)
+            with etapa("agregar_a_historia"):
+                # Añadir el turno a la historia clínica del paciente
+                self.__historias_clinicas__[dni].agregar_turno(nuevo)
 
-        # Añadir el turno a la historia clínica del paciente
-        self.__historias_clinicas__[dni].agregar_turno(nuevo)
+            with etapa("invalidar_cache"):
+                self.registrar_atencion(dni, medico)
+                self.incrementar_version_paciente(dni)
+                self.incrementar_version_medico(matricula)
 
     def emitir_receta(self, dni, matricula, medicamentos):
         """
@@ -222,11 +354,15 @@ class Clinica:
         if matricula not in self.__medicos__:
             raise MedicoNoExisteError(f"No existe médico Matrícula {matricula}.")
 
+        from modelos.receta import Receta
+
         paciente = self.__pacientes__[dni]
         medico    = self.__medicos__[matricula]
         # Crear la receta y añadirla a la historia clínica
         receta = Receta(paciente, medico, medicamentos)
         self.__historias_clinicas__[dni].agregar_receta(receta)
+        self.registrar_atencion(dni, medico)
+        self.incrementar_version_paciente(dni)
 
     def obtener_historia_clinica(self, dni):
         """
@@ -245,6 +381,130 @@ class Clinica:
             raise PacienteNoExisteError(f"No hay historia clínica para DNI {dni}.")
         return self.__historias_clinicas__[dni]
 
+    def obtener_historia_clinica_texto(self, dni):
+        """
+        Devuelve la historia clínica de un paciente ya renderizada como texto.
+
+        El resultado se guarda en la caché hasta que cambie la versión del
+        paciente, la revisión de la historia (nuevo turno o receta, aunque se
+        agregue directamente en la HistoriaClinica) o la de alguno de sus médicos.
+
+        Parámetros:
+            dni (str): DNI del paciente.
+
+        Retorno:
+            str: el mismo texto que str(HistoriaClinica).
+
+        Excepciones:
+            PacienteNoExisteError: si no existe historia clínica para ese DNI.
+        """
+        historia = self.obtener_historia_clinica(dni)
+        revisiones = tuple(
+            medico.obtener_revision() for medico in self.__medicos_por_paciente__.get(dni, ())
+        )
+        clave = ("historia", dni, self.obtener_version("paciente", dni),
+                 historia.obtener_revision(), revisiones)
+        return self.obtener_cache().obtener(clave, lambda: str(historia))
+
+    def obtener_agenda_medico(self, matricula, fecha):
+        """
+        Devuelve los turnos de un médico en un día, ordenados por hora.
+
+        Parámetros:
+            matricula (str): Matrícula del médico.
+            fecha (date | datetime): día a consultar.
+
+        Retorno:
+            list[Turno]: turnos del médico ese día.
+
+        Excepciones:
+            MedicoNoExisteError: si el médico no existe.
+        """
+        self.validar_existencia_medico(matricula)
+        if hasattr(fecha, "date"):
+            fecha = fecha.date()
+
+        def calcular():
+            turnos = [
+                turno for turno in self.__turnos__
+                if turno.obtener_medico().obtener_matricula() == matricula
+                and turno.obtener_fecha_hora().date() == fecha
+            ]
+            return tuple(sorted(turnos, key=lambda turno: turno.obtener_fecha_hora()))
+
+        clave = ("agenda", matricula, self.obtener_version("medico", matricula),
+                 self.__medicos__[matricula].obtener_revision(), fecha)
+        return list(self.obtener_cache().obtener(clave, calcular))
+
+    def consultar_disponibilidad(self, matricula, especialidad, fecha_hora):
+        """
+        Indica si se podría agendar un turno con el médico, la especialidad
+        y la fecha y hora indicadas, sin agendarlo.
+
+        Parámetros:
+            matricula (str): Matrícula del médico.
+            especialidad (str): Especialidad requerida.
+            fecha_hora (datetime): Fecha y hora a consultar.
+
+        Retorno:
+            bool: True si el médico atiende esa especialidad ese día y el
+            horario está libre.
+
+        Excepciones:
+            MedicoNoExisteError: si el médico no existe.
+        """
+        self.validar_existencia_medico(matricula)
+        medico = self.__medicos__[matricula]
+
+        def calcular():
+            dia_semana = self.obtener_dia_semana_en_espanol(fecha_hora)
+            try:
+                self.validar_especialidad_en_dia(medico, especialidad, dia_semana)
+                self.validar_turno_no_duplicado(matricula, fecha_hora)
+            except (EspecialidadNoDisponibleError, TurnoDuplicadoError):
+                return False
+            return True
+
+        clave = ("disponibilidad", matricula, self.obtener_version("medico", matricula),
+                 medico.obtener_revision(), especialidad.lower(), fecha_hora)
+        return self.obtener_cache().obtener(clave, calcular)
+
+    def obtener_cache(self):
+        """
+        Devuelve la caché de consultas, creándola en el primer uso para que
+        el arranque no cargue el módulo de caché.
+
+        Retorno:
+            CacheConsultas: caché con capacidad __capacidad_cache__.
+        """
+        if self.__cache__ is None:
+            from cache.cache_consultas import CacheConsultas
+            self.__cache__ = CacheConsultas(self.__capacidad_cache__)
+        return self.__cache__
+
+    def obtener_estadisticas_cache(self):
+        """
+        Devuelve las estadísticas de la caché de consultas (aciertos, fallos,
+        tasa de aciertos, desalojos y detalle por tipo de consulta).
+
+        Si todavía no se hizo ninguna consulta cacheada, devuelve estadísticas
+        en cero sin crear la caché.
+
+        Retorno:
+            dict: ver CacheConsultas.estadisticas.
+        """
+        if self.__cache__ is None:
+            return {
+                "aciertos": 0,
+                "fallos": 0,
+                "tasa_aciertos": 0.0,
+                "desalojos": 0,
+                "tamanio": 0,
+                "capacidad": self.__capacidad_cache__,
+                "por_consulta": {},
+            }
+        return self.__cache__.estadisticas()
+
     def obtener_turnos(self):
         """
         Devuelve la lista de todos los turnos agendados.
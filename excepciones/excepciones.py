@@ -9,3 +9,6 @@ class TurnoDuplicadoError(Exception):
 
 class EspecialidadNoDisponibleError(Exception):
     pass
+
+class ImagenEstadoInvalidaError(Exception):
+    pass
@@ -3,12 +3,18 @@ class HistoriaClinica:
         self.__paciente__ = paciente
         self.__turnos__ = []
         self.__recetas__ = []
+        self.__revision__ = 0 #Cambia con cada modificación, para invalidar cachés
 
     def agregar_turno(self, turno):
         self.__turnos__.append(turno)
+        self.__revision__ += 1
 
     def agregar_receta(self, receta):
         self.__recetas__.append(receta)
+        self.__revision__ += 1
+
+    def obtener_revision(self):
+        return self.__revision__
 
     def obtener_turnos(self):
         return list(self.__turnos__)
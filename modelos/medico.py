@@ -5,9 +5,14 @@ class Medico:
         self.__nombre__ = nombre
         self.__matricula__ = matricula
         self.__especialidades__ = []
+        self.__revision__ = 0 #Cambia con cada modificación, para invalidar cachés
 
     def agregar_especialidad(self, especialidad):
         self.__especialidades__.append(especialidad)
+        self.__revision__ += 1
+
+    def obtener_revision(self):
+        return self.__revision__
 
     def obtener_matricula(self):
         return self.__matricula__
@@ -10,7 +10,7 @@ class Turno:
         self.__especialidad__ = especialidad        
 
     def obtener_medico(self):
-        return self._medico
+        return self.__medico__
 
 
     def obtener_fecha_hora(self):
@@ -0,0 +1,178 @@
+from collections import deque
+from time import perf_counter_ns
+
+class _Etapa:
+    __slots__ = ("__trazador__", "__nombre__")
+
+    def __init__(self, trazador, nombre):
+        self.__trazador__ = trazador
+        self.__nombre__ = nombre
+
+    def __enter__(self):
+        self.__trazador__._abrir(self.__nombre__)
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.__trazador__._cerrar()
+        return False
+
+class Trazador:
+    def __init__(self, capacidad=65536):
+        """
+        Registra la duración de etapas anidadas en un buffer circular.
+
+        Cada registro es una tupla compacta (id_pila, inicio_ns, duracion_ns,
+        propio_ns), donde id_pila indexa la pila de nombres de etapas
+        (por ejemplo ("agendar_turno", "verificar_duplicado")) y propio_ns es
+        la duración sin contar las etapas hijas. Al llenarse el buffer se
+        descartan los registros más viejos, y se cuentan los descartados.
+
+        Parámetros:
+            capacidad (int): cantidad máxima de registros guardados.
+        """
+        if capacidad < 1:
+            raise ValueError("La capacidad del trazador debe ser al menos 1.")
+        self.__registros__ = deque(maxlen=capacidad)
+        self.__descartados__ = 0
+        self.__pilas__ = []
+        self.__ids_pila__ = {}
+        # Etapas abiertas: [nombre, inicio_ns, duración acumulada de las hijas]
+        self.__abiertas__ = []
+
+    def etapa(self, nombre):
+        """
+        Devuelve un context manager que mide la etapa `nombre`, anidada
+        dentro de las etapas que estén abiertas en ese momento.
+        """
+        return _Etapa(self, nombre)
+
+    def _abrir(self, nombre):
+        """Abre la etapa `nombre` dentro de las etapas abiertas. Lo usa _Etapa."""
+        self.__abiertas__.append([nombre, perf_counter_ns(), 0])
+
+    def _cerrar(self):
+        """
+        Cierra la etapa abierta más interna y guarda su registro. Lo usa _Etapa.
+
+        Excepciones:
+            RuntimeError: si no hay ninguna etapa abierta.
+        """
+        fin = perf_counter_ns()
+        if not self.__abiertas__:
+            raise RuntimeError("No hay ninguna etapa abierta para cerrar.")
+        pila = tuple(abierta[0] for abierta in self.__abiertas__)
+        _, inicio, hijas = self.__abiertas__.pop()
+        duracion = fin - inicio
+        if self.__abiertas__:
+            self.__abiertas__[-1][2] += duracion
+
+        id_pila = self.__ids_pila__.get(pila)
+        if id_pila is None:
+            id_pila = len(self.__pilas__)
+            self.__pilas__.append(pila)
+            self.__ids_pila__[pila] = id_pila
+        if len(self.__registros__) == self.__registros__.maxlen:
+            self.__descartados__ += 1
+        self.__registros__.append((id_pila, inicio, duracion, duracion - hijas))
+
+    def obtener_registros(self):
+        """
+        Devuelve los registros del buffer, del más viejo al más nuevo.
+
+        Retorno:
+            list[tuple]: (pila, inicio_ns, duracion_ns, propio_ns) por etapa.
+        """
+        return [
+            (self.__pilas__[id_pila], inicio, duracion, propio)
+            for id_pila, inicio, duracion, propio in self.__registros__
+        ]
+
+    def obtener_descartados(self):
+        """
+        Devuelve cuántos registros se descartaron por falta de lugar en el
+        buffer. Si es mayor que cero, el resumen y las exportaciones solo
+        cubren los registros más recientes.
+        """
+        return self.__descartados__
+
+    def limpiar(self):
+        """Descarta los registros guardados y reinicia el conteo de descartados."""
+        self.__registros__.clear()
+        self.__descartados__ = 0
+
+    def resumen(self):
+        """
+        Agrupa los registros del buffer por pila de etapas (sin contar los
+        descartados, ver obtener_descartados).
+
+        Retorno:
+            dict: pila (str "a;b") → {"llamadas", "total_ns", "propio_ns"}.
+        """
+        resumen = {}
+        for pila, _, duracion, propio in self.obtener_registros():
+            datos = resumen.setdefault(";".join(pila), {"llamadas": 0, "total_ns": 0, "propio_ns": 0})
+            datos["llamadas"] += 1
+            datos["total_ns"] += duracion
+            datos["propio_ns"] += propio
+        return resumen
+
+    def exportar_pilas_plegadas(self, archivo):
+        """
+        Escribe los registros en formato de pilas plegadas ("a;b;c valor"),
+        una línea por pila con su tiempo propio total en nanosegundos.
+
+        Es el formato de entrada de flamegraph.pl, inferno y speedscope.
+
+        Parámetros:
+            archivo: objeto de texto con método write.
+        """
+        for pila, datos in self.resumen().items():
+            if datos["propio_ns"] > 0:
+                archivo.write(f"{pila} {datos['propio_ns']}\n")
+
+    def exportar_speedscope(self, archivo, nombre="clinica"):
+        """
+        Escribe los registros como perfil "evented" de speedscope (JSON),
+        que conserva el orden temporal de cada etapa.
+
+        Parámetros:
+            archivo: objeto de texto con método write.
+            nombre (str): nombre del perfil mostrado por speedscope.
+        """
+        import json
+
+        frames = []
+        indice_frames = {}
+        eventos = []
+        for pila, inicio, duracion, _ in self.obtener_registros():
+            etapa = pila[-1]
+            if etapa not in indice_frames:
+                indice_frames[etapa] = len(frames)
+                frames.append({"name": etapa})
+            frame = indice_frames[etapa]
+            profundidad = len(pila)
+            # Orden: primero los cierres, de la etapa más interna a la más
+            # externa, y luego las aperturas, de la más externa a la más interna
+            eventos.append((inicio, 1, profundidad, "O", frame))
+            eventos.append((inicio + duracion, 0, -profundidad, "C", frame))
+        eventos.sort()
+
+        inicio_perfil = eventos[0][0] if eventos else 0
+        fin_perfil = eventos[-1][0] if eventos else 0
+        perfil = {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "evented",
+                "name": nombre,
+                "unit": "nanoseconds",
+                "startValue": 0,
+                "endValue": fin_perfil - inicio_perfil,
+                "events": [
+                    {"type": tipo, "frame": frame, "at": momento - inicio_perfil}
+                    for momento, _, _, tipo, frame in eventos
+                ],
+            }],
+            "exporter": "gestion_clinica",
+        }
+        json.dump(perfil, archivo)
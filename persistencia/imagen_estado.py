@@ -0,0 +1,76 @@
+import mmap
+import os
+import pickle
+import struct
+
+from excepciones.excepciones import ImagenEstadoInvalidaError
+
+# Cabecera fija: firma mágica, versión del formato y longitud del contenido
+MAGIA = b"CLINIMG\x00"
+VERSION_FORMATO = 5
+CABECERA = struct.Struct("<8sHQ")
+
+
+def guardar_imagen(clinica, ruta):
+    """
+    Guarda una imagen binaria precompilada del estado de la clínica.
+
+    Parámetros:
+        clinica (Clinica): instancia cuyo estado (diccionarios e índices)
+            se serializa completo.
+        ruta (str): archivo de destino.
+
+    Efecto:
+        - Escribe la cabecera versionada seguida del contenido serializado.
+        - El archivo se reemplaza de forma atómica, nunca queda a medio escribir,
+          y si la escritura falla se elimina el temporal.
+    """
+    contenido = pickle.dumps(clinica, protocol=pickle.HIGHEST_PROTOCOL)
+    temporal = f"{ruta}.tmp"
+    try:
+        with open(temporal, "wb") as archivo:
+            archivo.write(CABECERA.pack(MAGIA, VERSION_FORMATO, len(contenido)))
+            archivo.write(contenido)
+        os.replace(temporal, ruta)
+    except BaseException:
+        # No dejar el temporal a medio escribir si la escritura falla
+        try:
+            os.remove(temporal)
+        except OSError:
+            pass
+        raise
+
+
+def cargar_imagen(ruta):
+    """
+    Carga una imagen de estado generada con guardar_imagen.
+
+    El archivo se mapea en memoria y se deserializa directamente desde el
+    mapeo, sin reconstruir la clínica objeto por objeto.
+
+    Parámetros:
+        ruta (str): archivo de origen.
+
+    Retorno:
+        Clinica: instancia con el estado restaurado.
+
+    Excepciones:
+        ImagenEstadoInvalidaError: si el archivo no es una imagen válida o
+            fue generado con otra versión del formato.
+    """
+    with open(ruta, "rb") as archivo:
+        tamanio = os.fstat(archivo.fileno()).st_size
+        if tamanio < CABECERA.size:
+            raise ImagenEstadoInvalidaError(f"El archivo {ruta} no es una imagen de estado.")
+        with mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            magia, version, longitud = CABECERA.unpack_from(mapa)
+            if magia != MAGIA:
+                raise ImagenEstadoInvalidaError(f"El archivo {ruta} no es una imagen de estado.")
+            if version != VERSION_FORMATO:
+                raise ImagenEstadoInvalidaError(
+                    f"Versión de imagen {version} incompatible (se esperaba {VERSION_FORMATO})."
+                )
+            if CABECERA.size + longitud != tamanio:
+                raise ImagenEstadoInvalidaError(f"La imagen {ruta} está truncada o corrupta.")
+            with memoryview(mapa)[CABECERA.size:] as contenido:
+                return pickle.loads(contenido)
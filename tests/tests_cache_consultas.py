@@ -0,0 +1,132 @@
+import unittest
+from datetime import datetime, date
+
+from clinica import Clinica
+from cache.cache_consultas import CacheConsultas
+from modelos.paciente import Paciente
+from modelos.medico import Medico
+from modelos.especialidad import Especialidad
+from modelos.receta import Receta
+from excepciones.excepciones import MedicoNoExisteError, PacienteNoExisteError
+
+# 06/01/2025 es lunes, 07/01/2025 es martes
+LUNES = datetime(2025, 1, 6, 10, 0)
+MARTES = datetime(2025, 1, 7, 10, 0)
+
+class TestCacheConsultas(unittest.TestCase):
+    def test_acierto_y_fallo(self):
+        cache = CacheConsultas(2)
+        self.assertEqual(cache.obtener(("a", 1), lambda: "uno"), "uno")
+        self.assertEqual(cache.obtener(("a", 1), lambda: "otro"), "uno")
+        estadisticas = cache.estadisticas()
+        self.assertEqual(estadisticas["aciertos"], 1)
+        self.assertEqual(estadisticas["fallos"], 1)
+        self.assertEqual(estadisticas["tasa_aciertos"], 0.5)
+
+    def test_desaloja_la_menos_usada(self):
+        cache = CacheConsultas(2)
+        cache.obtener(("a", 1), lambda: 1)
+        cache.obtener(("a", 2), lambda: 2)
+        cache.obtener(("a", 1), lambda: 1)
+        cache.obtener(("a", 3), lambda: 3)
+        self.assertEqual(cache.obtener(("a", 1), lambda: "recalculado"), 1)
+        self.assertEqual(cache.obtener(("a", 2), lambda: "recalculado"), "recalculado")
+        self.assertEqual(cache.estadisticas()["tamanio"], 2)
+
+    def test_capacidad_invalida(self):
+        with self.assertRaises(ValueError):
+            CacheConsultas(0)
+
+class TestClinicaCache(unittest.TestCase):
+    def setUp(self):
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("Juan Perez", "12345678", "01/01/1990"))
+        self.clinica.agregar_paciente(Paciente("Ana Gomez", "87654321", "02/02/1985"))
+        medico = Medico("Dr. House", "M001")
+        medico.agregar_especialidad(Especialidad("Diagnóstico", ["lunes"]))
+        self.clinica.agregar_medico(medico)
+
+    def test_historia_texto_igual_a_str(self):
+        self.clinica.agendar_turno("12345678", "M001", "Diagnóstico", LUNES)
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(self.clinica.obtener_historia_clinica_texto("12345678"), str(historia))
+
+    def test_historia_texto_cacheada(self):
+        self.clinica.obtener_historia_clinica_texto("12345678")
+        self.clinica.obtener_historia_clinica_texto("12345678")
+        por_consulta = self.clinica.obtener_estadisticas_cache()["por_consulta"]
+        self.assertEqual(por_consulta["historia"]["aciertos"], 1)
+        self.assertEqual(por_consulta["historia"]["fallos"], 1)
+
+    def test_receta_invalida_solo_la_historia_del_paciente(self):
+        self.clinica.obtener_historia_clinica_texto("12345678")
+        self.clinica.obtener_historia_clinica_texto("87654321")
+        self.clinica.emitir_receta("12345678", "M001", ["MedA"])
+        self.assertIn("MedA", self.clinica.obtener_historia_clinica_texto("12345678"))
+        self.clinica.obtener_historia_clinica_texto("87654321")
+        por_consulta = self.clinica.obtener_estadisticas_cache()["por_consulta"]
+        self.assertEqual(por_consulta["historia"]["aciertos"], 1)
+        self.assertEqual(por_consulta["historia"]["fallos"], 3)
+
+    def test_turno_invalida_historia_y_agenda(self):
+        self.assertEqual(self.clinica.obtener_agenda_medico("M001", LUNES.date()), [])
+        self.clinica.obtener_historia_clinica_texto("12345678")
+        self.clinica.agendar_turno("12345678", "M001", "Diagnóstico", LUNES)
+        agenda = self.clinica.obtener_agenda_medico("M001", LUNES.date())
+        self.assertEqual(len(agenda), 1)
+        self.assertIn("Diagnóstico", self.clinica.obtener_historia_clinica_texto("12345678"))
+
+    def test_agenda_ordenada_por_hora(self):
+        self.clinica.agendar_turno("12345678", "M001", "Diagnóstico", LUNES.replace(hour=12))
+        self.clinica.agendar_turno("87654321", "M001", "Diagnóstico", LUNES)
+        agenda = self.clinica.obtener_agenda_medico("M001", date(2025, 1, 6))
+        self.assertEqual([t.obtener_fecha_hora().hour for t in agenda], [10, 12])
+
+    def test_disponibilidad(self):
+        self.assertTrue(self.clinica.consultar_disponibilidad("M001", "diagnóstico", LUNES))
+        self.assertFalse(self.clinica.consultar_disponibilidad("M001", "Diagnóstico", MARTES))
+        self.clinica.agendar_turno("12345678", "M001", "Diagnóstico", LUNES)
+        self.assertFalse(self.clinica.consultar_disponibilidad("M001", "Diagnóstico", LUNES))
+
+    def test_nueva_especialidad_invalida_disponibilidad_e_historias(self):
+        self.clinica.agendar_turno("12345678", "M001", "Diagnóstico", LUNES)
+        self.assertFalse(self.clinica.consultar_disponibilidad("M001", "Pediatría", MARTES))
+        self.clinica.agregar_especialidad("M001", Especialidad("Pediatría", ["martes"]))
+        self.assertTrue(self.clinica.consultar_disponibilidad("M001", "Pediatría", MARTES))
+        self.assertIn("Pediatría", self.clinica.obtener_historia_clinica_texto("12345678"))
+
+    def test_especialidad_agregada_directo_al_medico_invalida_cache(self):
+        self.clinica.agendar_turno("12345678", "M001", "Diagnóstico", LUNES)
+        self.clinica.obtener_historia_clinica_texto("12345678")
+        self.assertFalse(self.clinica.consultar_disponibilidad("M001", "Pediatría", MARTES))
+        medico = self.clinica.obtener_medico_por_matricula("M001")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["martes"]))
+        self.assertTrue(self.clinica.consultar_disponibilidad("M001", "Pediatría", MARTES))
+        self.assertIn("Pediatría", self.clinica.obtener_historia_clinica_texto("12345678"))
+        self.clinica.agendar_turno("87654321", "M001", "Pediatría", MARTES)
+
+    def test_receta_agregada_directo_a_la_historia_invalida_cache(self):
+        self.clinica.obtener_historia_clinica_texto("12345678")
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        paciente = self.clinica.obtener_pacientes()[0]
+        medico = self.clinica.obtener_medico_por_matricula("M001")
+        historia.agregar_receta(Receta(paciente, medico, ["MedB"]))
+        self.assertIn("MedB", self.clinica.obtener_historia_clinica_texto("12345678"))
+
+    def test_estadisticas_sin_consultas(self):
+        clinica = Clinica(capacidad_cache=8)
+        self.assertEqual(clinica.obtener_estadisticas_cache(), CacheConsultas(8).estadisticas())
+        self.assertIsNone(clinica.__cache__)
+
+    def test_consultas_entidad_inexistente(self):
+        with self.assertRaises(MedicoNoExisteError):
+            self.clinica.obtener_agenda_medico("M999", LUNES)
+        with self.assertRaises(MedicoNoExisteError):
+            self.clinica.consultar_disponibilidad("M999", "Diagnóstico", LUNES)
+        with self.assertRaises(MedicoNoExisteError):
+            self.clinica.agregar_especialidad("M999", Especialidad("Pediatría", ["martes"]))
+        with self.assertRaises(PacienteNoExisteError):
+            self.clinica.obtener_historia_clinica_texto("00000000")
+
+if __name__ == "__main__":
+    unittest.main()
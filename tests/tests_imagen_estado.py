@@ -0,0 +1,148 @@
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from datetime import datetime
+
+from cli import crear_cli
+from clinica import Clinica
+from modelos.paciente import Paciente
+from modelos.medico import Medico
+from modelos.especialidad import Especialidad
+from persistencia.imagen_estado import guardar_imagen, cargar_imagen, CABECERA, MAGIA
+from excepciones.excepciones import ImagenEstadoInvalidaError
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class TestImagenEstado(unittest.TestCase):
+    def setUp(self):
+        self.clinica = Clinica()
+        self.paciente = Paciente("Juan Perez", "12345678", "01/01/1990")
+        self.medico = Medico("Dr. House", "M001")
+        self.medico.agregar_especialidad(Especialidad("Diagnóstico", ["lunes"]))
+        self.clinica.agregar_paciente(self.paciente)
+        self.clinica.agregar_medico(self.medico)
+        # 06/01/2025 es lunes
+        self.clinica.agendar_turno("12345678", "M001", "Diagnóstico", datetime(2025, 1, 6, 10, 0))
+        self.clinica.emitir_receta("12345678", "M001", ["MedA"])
+
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clinica.img")
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_guardar_y_cargar_imagen(self):
+        guardar_imagen(self.clinica, self.ruta)
+        restaurada = cargar_imagen(self.ruta)
+        self.assertEqual(len(restaurada.obtener_pacientes()), 1)
+        self.assertEqual(len(restaurada.obtener_medicos()), 1)
+        self.assertEqual(len(restaurada.obtener_turnos()), 1)
+        historia = restaurada.obtener_historia_clinica("12345678")
+        self.assertEqual(str(historia), str(self.clinica.obtener_historia_clinica("12345678")))
+
+    def test_imagen_restaurada_comparte_objetos(self):
+        guardar_imagen(self.clinica, self.ruta)
+        restaurada = cargar_imagen(self.ruta)
+        turno = restaurada.obtener_turnos()[0]
+        self.assertIs(turno.obtener_medico(), restaurada.obtener_medico_por_matricula("M001"))
+
+    def test_imagen_no_incluye_cache(self):
+        self.clinica.obtener_historia_clinica_texto("12345678")
+        guardar_imagen(self.clinica, self.ruta)
+        restaurada = cargar_imagen(self.ruta)
+        self.assertEqual(restaurada.obtener_estadisticas_cache()["tamanio"], 0)
+        self.assertEqual(
+            restaurada.obtener_historia_clinica_texto("12345678"),
+            self.clinica.obtener_historia_clinica_texto("12345678"),
+        )
+
+    def test_guardar_fallido_no_deja_temporal(self):
+        destino = os.path.join(self.directorio.name, "es_un_directorio")
+        os.mkdir(destino)
+        with self.assertRaises(OSError):
+            guardar_imagen(self.clinica, destino)
+        self.assertFalse(os.path.exists(destino + ".tmp"))
+
+    def test_cargar_archivo_invalido(self):
+        with open(self.ruta, "wb") as archivo:
+            archivo.write(b"no es una imagen de estado")
+        with self.assertRaises(ImagenEstadoInvalidaError):
+            cargar_imagen(self.ruta)
+
+    def test_cargar_archivo_vacio(self):
+        open(self.ruta, "wb").close()
+        with self.assertRaises(ImagenEstadoInvalidaError):
+            cargar_imagen(self.ruta)
+
+    def test_cargar_version_incompatible(self):
+        guardar_imagen(self.clinica, self.ruta)
+        with open(self.ruta, "r+b") as archivo:
+            _, _, longitud = CABECERA.unpack(archivo.read(CABECERA.size))
+            archivo.seek(0)
+            archivo.write(CABECERA.pack(MAGIA, 999, longitud))
+        with self.assertRaises(ImagenEstadoInvalidaError):
+            cargar_imagen(self.ruta)
+
+    def test_cargar_imagen_truncada(self):
+        guardar_imagen(self.clinica, self.ruta)
+        with open(self.ruta, "r+b") as archivo:
+            archivo.truncate(os.path.getsize(self.ruta) - 1)
+        with self.assertRaises(ImagenEstadoInvalidaError):
+            cargar_imagen(self.ruta)
+
+class TestCrearCli(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clinica.img")
+        clinica = Clinica()
+        clinica.agregar_paciente(Paciente("Juan Perez", "12345678", "01/01/1990"))
+        guardar_imagen(clinica, self.ruta)
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def crear_cli_fallido(self, argumentos):
+        with redirect_stderr(io.StringIO()) as errores:
+            with self.assertRaises(SystemExit):
+                crear_cli(argumentos)
+        return errores.getvalue()
+
+    def test_sin_argumentos(self):
+        cli = crear_cli([])
+        self.assertEqual(cli.__clinica__.obtener_pacientes(), [])
+
+    def test_imagen_con_igual(self):
+        cli = crear_cli([f"--imagen={self.ruta}"])
+        self.assertEqual(len(cli.__clinica__.obtener_pacientes()), 1)
+
+    def test_argumento_desconocido(self):
+        self.assertIn("--imgen", self.crear_cli_fallido(["--imgen", self.ruta]))
+
+    def test_imagen_inexistente(self):
+        errores = self.crear_cli_fallido(["--imagen", self.ruta + ".no"])
+        self.assertIn("no se pudo cargar la imagen", errores)
+
+    def test_imagen_invalida(self):
+        with open(self.ruta, "wb") as archivo:
+            archivo.write(b"no es una imagen de estado")
+        errores = self.crear_cli_fallido(["--imagen", self.ruta])
+        self.assertIn("no se pudo cargar la imagen", errores)
+
+class TestArranqueDiferido(unittest.TestCase):
+    def test_importar_cli_no_carga_modulos_diferidos(self):
+        codigo = (
+            "import sys, cli; "
+            "print(','.join(m for m in sys.modules if m.split('.')[0] in ('modelos', 'cache', 'perfilado')))"
+        )
+        resultado = subprocess.run(
+            [sys.executable, "-c", codigo], cwd=RAIZ,
+            capture_output=True, text=True, check=True,
+        )
+        self.assertEqual(resultado.stdout.strip(), "")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import io
+import json
+import unittest
+from datetime import datetime
+
+from clinica import Clinica
+from modelos.paciente import Paciente
+from modelos.medico import Medico
+from modelos.especialidad import Especialidad
+from perfilado.trazador import Trazador
+from excepciones.excepciones import TurnoDuplicadoError
+
+# 06/01/2025 es lunes
+LUNES = datetime(2025, 1, 6, 10, 0)
+
+ETAPAS = [
+    "validar_existencia",
+    "resolver_dia_semana",
+    "buscar_especialidad",
+    "verificar_duplicado",
+    "construir_turno",
+    "agregar_a_historia",
+    "invalidar_cache",
+]
+
+class TestTrazador(unittest.TestCase):
+    def test_etapas_anidadas(self):
+        trazador = Trazador()
+        with trazador.etapa("a"):
+            with trazador.etapa("b"):
+                pass
+        registros = trazador.obtener_registros()
+        self.assertEqual([r[0] for r in registros], [("a", "b"), ("a",)])
+        _, _, duracion_a, propio_a = registros[1]
+        self.assertEqual(duracion_a - propio_a, registros[0][2])
+
+    def test_buffer_circular(self):
+        trazador = Trazador(capacidad=3)
+        for nombre in "abcde":
+            with trazador.etapa(nombre):
+                pass
+        self.assertEqual([r[0] for r in trazador.obtener_registros()], [("c",), ("d",), ("e",)])
+        self.assertEqual(trazador.obtener_descartados(), 2)
+        trazador.limpiar()
+        self.assertEqual(trazador.obtener_descartados(), 0)
+
+    def test_registra_etapa_con_excepcion(self):
+        trazador = Trazador()
+        with self.assertRaises(KeyError):
+            with trazador.etapa("a"):
+                raise KeyError("x")
+        self.assertEqual(len(trazador.obtener_registros()), 1)
+
+    def test_capacidad_invalida(self):
+        with self.assertRaises(ValueError):
+            Trazador(capacidad=0)
+
+    def test_cerrar_sin_etapa_abierta(self):
+        trazador = Trazador()
+        etapa = trazador.etapa("a")
+        with self.assertRaises(RuntimeError):
+            etapa.__exit__(None, None, None)
+
+class TestClinicaTrazado(unittest.TestCase):
+    def setUp(self):
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("Juan Perez", "12345678", "01/01/1990"))
+        medico = Medico("Dr. House", "M001")
+        medico.agregar_especialidad(Especialidad("Diagnóstico", ["lunes"]))
+        self.clinica.agregar_medico(medico)
+        self.trazador = Trazador()
+        self.clinica.activar_trazado(self.trazador)
+
+    def test_agendar_turno_registra_etapas(self):
+        self.clinica.agendar_turno("12345678", "M001", "Diagnóstico", LUNES)
+        pilas = [r[0] for r in self.trazador.obtener_registros()]
+        self.assertEqual(pilas, [("agendar_turno", e) for e in ETAPAS] + [("agendar_turno",)])
+
+    def test_turno_rechazado_registra_etapas_hasta_el_error(self):
+        self.clinica.agendar_turno("12345678", "M001", "Diagnóstico", LUNES)
+        self.trazador.limpiar()
+        with self.assertRaises(TurnoDuplicadoError):
+            self.clinica.agendar_turno("12345678", "M001", "Diagnóstico", LUNES)
+        pilas = [r[0] for r in self.trazador.obtener_registros()]
+        self.assertEqual(pilas, [("agendar_turno", e) for e in ETAPAS[:4]] + [("agendar_turno",)])
+
+    def test_desactivar_trazado(self):
+        self.clinica.desactivar_trazado()
+        self.clinica.agendar_turno("12345678", "M001", "Diagnóstico", LUNES)
+        self.assertEqual(self.trazador.obtener_registros(), [])
+
+    def test_exportar_pilas_plegadas(self):
+        self.clinica.agendar_turno("12345678", "M001", "Diagnóstico", LUNES)
+        salida = io.StringIO()
+        self.trazador.exportar_pilas_plegadas(salida)
+        for linea in salida.getvalue().splitlines():
+            pila, valor = linea.rsplit(" ", 1)
+            self.assertTrue(pila.startswith("agendar_turno"))
+            self.assertGreater(int(valor), 0)
+
+    def test_exportar_speedscope_eventos_balanceados(self):
+        self.clinica.agendar_turno("12345678", "M001", "Diagnóstico", LUNES)
+        salida = io.StringIO()
+        self.trazador.exportar_speedscope(salida)
+        perfil = json.loads(salida.getvalue())
+        frames = [f["name"] for f in perfil["shared"]["frames"]]
+        self.assertEqual(sorted(frames), sorted(ETAPAS + ["agendar_turno"]))
+        abiertos = []
+        for evento in perfil["profiles"][0]["events"]:
+            if evento["type"] == "O":
+                abiertos.append(evento["frame"])
+            else:
+                self.assertEqual(abiertos.pop(), evento["frame"])
+        self.assertEqual(abiertos, [])
+
+if __name__ == "__main__":
+    unittest.main()